@@ -2,40 +2,300 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+from plotly_resampler import FigureResampler
 from datetime import datetime
 import numpy as np
+import os
+import tempfile
+import io
 
 # Set page config
 st.set_page_config(page_title="Enrollment Management Dashboard", layout="wide")
 
+# Define custom grade order
+grade_order = [
+    'Pre-Nursery', 'Nursery', 'Pre-Kindergarten', 'Kindergarten',
+    'Grade 1', 'Grade 2', 'Grade 3', 'Grade 4', 'Grade 5', 'Grade 6',
+    'Grade 7', 'Grade 8', 'Grade 9', 'Grade 10', 'Grade 11', 'Grade 12',
+    'Post Graduate', 'Summer'
+]
+
+# Define month order for academic year
+month_order = [
+    'August', 'September', 'October', 'November', 'December',
+    'January', 'February', 'March', 'April', 'May', 'June', 'July'
+]
+
+# Low-cardinality text columns stored as pandas categoricals
+category_columns = ['Candidate Status', 'Candidate Decision', 'Gender',
+                    'International', 'Financial Aid', 'Entering Year']
+
+# Cap on cached entries per year-selection helper; with 29 selectable years the
+# number of possible selections is effectively unbounded, so old entries are evicted
+selection_cache_size = 16
+
 # Load data
 @st.cache_data
 def load_data():
     # Update the path to where your CSV file is located
-    df = pd.read_csv("data/enrollment.csv")
+    csv_path = "data/enrollment.csv"
+    parquet_path = "data/enrollment.parquet"
     
-    # Convert date columns to datetime
-    date_columns = ['Inquiry Date Submitted', 'Application Date Submitted', 
-                   'Candidate decision date', 'School Decision Date']
-    for col in date_columns:
-        df[col] = pd.to_datetime(df[col], errors='coerce')
+    # CSV modification time, returned so the helpers below can key their caches on it
+    data_version = os.path.getmtime(csv_path)
     
-    return df
+    # Convert the CSV to Parquet once (and again whenever the CSV changes)
+    df = None
+    if not os.path.exists(parquet_path) or os.path.getmtime(parquet_path) < os.path.getmtime(csv_path):
+        df = pd.read_csv(csv_path)
+        
+        # Convert date columns to datetime using each column's export format;
+        # only values that don't match fall back to the slower 'mixed' parser
+        date_formats = {
+            'Inquiry Date Submitted': '%b %d %Y %I:%M %p',
+            'Application Date Submitted': '%m/%d/%Y %I:%M:%S %p',
+            'Candidate decision date': 'ISO8601',
+            'School Decision Date': 'ISO8601',
+        }
+        for col, fmt in date_formats.items():
+            parsed = pd.to_datetime(df[col], format=fmt, errors='coerce')
+            unparsed = parsed.isna() & df[col].notna()
+            if unparsed.any():
+                parsed[unparsed] = pd.to_datetime(df.loc[unparsed, col], format='mixed', errors='coerce')
+            df[col] = parsed
+        
+        # Write to a temp file and swap it in, so a failed write never leaves a
+        # truncated Parquet file behind; on a read-only checkout keep the parsed frame
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(parquet_path), suffix='.parquet.tmp')
+            os.close(fd)
+            df.to_parquet(tmp_path, engine='pyarrow', compression='snappy')
+            # mkstemp creates the file as 0600; make the cache readable like the CSV beside it
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, parquet_path)
+            tmp_path = None
+        except OSError:
+            pass
+        finally:
+            # Never leave a temp file behind, whatever the write raised
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    
+    # Parquet keeps the datetime dtypes, so no re-parsing is needed here
+    if df is None:
+        df = pd.read_parquet(parquet_path, engine='pyarrow')
+    
+    # Store repeated labels as categories so comparisons and counts work on integer codes
+    for col in category_columns:
+        df[col] = df[col].astype('category')
+    
+    # Grades are ordered; any grade missing from grade_order is kept at the end
+    grades = grade_order + sorted(set(df['Entering Grade'].dropna()) - set(grade_order))
+    df['Entering Grade'] = pd.Categorical(df['Entering Grade'], categories=grades, ordered=True)
+    
+    # Derived columns used by the timeline tab (application month as a month-start timestamp)
+    df['Application Month'] = df['Application Date Submitted'].dt.to_period('M').dt.to_timestamp()
+    df['Days_to_Decision'] = (df['School Decision Date'] - 
+                              df['Application Date Submitted']).dt.days.astype('Int32')
+    
+    # Downcast numeric columns to the smallest dtype that holds their values
+    for col in df.select_dtypes(include='integer').columns:
+        df[col] = pd.to_numeric(df[col], downcast='integer')
+    for col in df.select_dtypes(include='floating').columns:
+        df[col] = pd.to_numeric(df[col], downcast='float')
+    
+    # Average days to decision per year, so the timeline tab only has to look years up
+    decision_by_year = df.groupby('Entering Year', observed=True)['Days_to_Decision'].mean().astype('float32')
+    
+    return df, decision_by_year, data_version
+
+# The helpers below take the loaded frame as _df, which st.cache_data does not hash,
+# plus data_version from load_data, so their caches are keyed to the data they were built from
+
+# Pre-aggregate row counts once so the charts sum a small table instead of rescanning every row
+@st.cache_data
+def build_summary(_df, data_version):
+    return (
+        _df.assign(InquiryMonth=_df['Inquiry Date Submitted'].dt.month_name()
+                   .astype(pd.CategoricalDtype(month_order, ordered=True)))
+        .groupby(['Entering Year', 'Candidate Status', 'Candidate Decision', 'Entering Grade',
+                  'InquiryMonth', 'Application Month'], observed=True, dropna=False)
+        .size()
+        .rename('n')
+        .reset_index()
+    )
+
+# Rows for the selected years, cached per year selection
+@st.cache_data(max_entries=selection_cache_size)
+def filter_df(_df, data_version, years):
+    return _df[_df['Entering Year'].isin(years)]
+
+# Demographic breakdowns for the selected years, counted together and cached
+@st.cache_data(max_entries=selection_cache_size)
+def demographics(_df, data_version, years):
+    sub = filter_df(_df, data_version, years)
+    # Categorical value_counts include unused categories; keep only values with rows
+    return (sub['Gender'].value_counts()[lambda counts: counts > 0],
+            sub['International'].value_counts()[lambda counts: counts > 0],
+            sub['Financial Aid'].value_counts()[lambda counts: counts > 0])
+
+# Download payloads, cached per year selection so they are only serialized once
+@st.cache_data(max_entries=selection_cache_size)
+def to_csv_bytes(_df, data_version, years):
+    return filter_df(_df, data_version, years).to_csv(index=False).encode('utf-8')
 
-df = load_data()
+@st.cache_data(max_entries=selection_cache_size)
+def to_parquet_bytes(_df, data_version, years):
+    buffer = io.BytesIO()
+    filter_df(_df, data_version, years).to_parquet(buffer, engine='pyarrow', index=False)
+    return buffer.getvalue()
+
+# Chart builders take only the small aggregates they plot and return cached
+# figures, so charts whose data has not changed are not rebuilt on rerun
+@st.cache_data
+def build_funnel(stages, stage_counts):
+    fig_funnel = go.Figure(go.Funnel(
+        y=list(stages),
+        x=list(stage_counts),
+        textinfo="value+percent initial"
+    ))
+    fig_funnel.update_layout(title_text="Application Pipeline Funnel")
+    return fig_funnel
+
+@st.cache_data
+def build_status_by_grade(status_by_grade):
+    fig_status = px.bar(status_by_grade,
+                       barmode='group',
+                       title="Application Status by Grade Level")
+    return fig_status
+
+@st.cache_data
+def build_grade_inquiries(grades, counts):
+    fig_grade_inquiry = go.Figure()
+    fig_grade_inquiry.add_trace(go.Bar(
+        x=list(counts),
+        y=list(grades),
+        orientation='h',
+        marker_color='#3182CE',
+        text=list(counts),
+        textposition='outside',
+    ))
+    
+    fig_grade_inquiry.update_layout(
+        title="Inquiries by Grade Level",
+        height=400,
+        yaxis={
+            'categoryorder': 'array',
+            'categoryarray': list(grades)[::-1],
+            'title': '',
+        },
+        xaxis={
+            'title': 'Number of Inquiries',
+            'showgrid': True,
+            'gridwidth': 1,
+            'gridcolor': 'LightGray'
+        },
+        showlegend=False,
+        margin=dict(l=20, r=20, t=40, b=20),
+        plot_bgcolor='white',
+    )
+    return fig_grade_inquiry
+
+@st.cache_data
+def build_monthly_inquiries(months, counts):
+    # Create the horizontal bar chart (months are passed in top-to-bottom order)
+    fig_monthly_inquiry = go.Figure()
+    
+    fig_monthly_inquiry.add_trace(go.Bar(
+        x=list(counts),
+        y=list(months),
+        orientation='h',
+        marker_color='#3182CE',
+        text=list(counts),
+        textposition='outside',
+    ))
+    
+    fig_monthly_inquiry.update_layout(
+        title="Inquiries by Month",
+        height=400,
+        yaxis={
+            'categoryorder': 'array',
+            'categoryarray': list(months),
+            'title': '',
+        },
+        xaxis={
+            'title': 'Number of Inquiries',
+            'showgrid': True,
+            'gridwidth': 1,
+            'gridcolor': 'LightGray',
+            'range': [0, max(counts, default=0) * 1.1]  # Add 10% padding
+        },
+        showlegend=False,
+        margin=dict(l=20, r=20, t=40, b=20),
+        plot_bgcolor='white',
+    )
+    return fig_monthly_inquiry
+
+@st.cache_data
+def build_pie(labels, values, title):
+    fig_pie = px.pie(values=list(values),
+                     names=list(labels),
+                     title=title)
+    return fig_pie
+
+@st.cache_data
+def build_financial_aid(labels, values):
+    # A frame (rather than bare lists) lets px.bar accept an empty selection
+    fig_fa = px.bar(pd.DataFrame({'x': list(labels), 'y': list(values)}),
+                    x='x',
+                    y='y',
+                    title="Financial Aid Distribution")
+    return fig_fa
+
+@st.cache_data
+def build_timeline(monthly_apps):
+    fig_line = px.line(
+        monthly_apps,
+        x='Month',
+        y='Number of Applications',
+        title="Application Submissions Over Time",
+        markers=True
+    )
+    # FigureResampler downsamples (LTTB) to at most 1000 points per trace. Without a
+    # Dash callback this is a one-off static downsample, so keep only the plain
+    # downsampled figure (not the full-resolution data) and drop the "[R] ~5D" trace name
+    fig_timeline = go.Figure(FigureResampler(fig_line, default_n_shown_samples=1000))
+    fig_timeline.update_traces(name='')
+    return fig_timeline
+
+@st.cache_data
+def build_decision_time(avg_decision_time):
+    fig_decision_time = px.bar(
+        avg_decision_time,
+        x='Year',
+        y='Average Days',
+        title="Average Days to Decision by Year"
+    )
+    return fig_decision_time
+
+df, decision_by_year, data_version = load_data()
+summary = build_summary(df, data_version)
 
 # Sidebar for global filters
 st.sidebar.title("Filters")
 
-# Year filter
+# Year filter (categories of the cached frame are already the sorted unique years)
+all_years = df['Entering Year'].cat.categories.tolist()
 selected_years = st.sidebar.multiselect(
     "Select Academic Years",
-    options=sorted(df['Entering Year'].unique()),
-    default=sorted(df['Entering Year'].unique())[-3:]  # Last 3 years by default
+    options=all_years,
+    default=all_years[-3:]  # Last 3 years by default
 )
 
-# Apply filters
-filtered_df = df[df['Entering Year'].isin(selected_years)]
+# Apply filters (row-level data is only materialized by the cached helpers that need it)
+year_key = tuple(sorted(selected_years))
+filtered_summary = summary[summary['Entering Year'].isin(selected_years)]
 
 # Main dashboard title
 st.title("Enrollment Management Dashboard")
@@ -43,11 +303,16 @@ st.title("Enrollment Management Dashboard")
 # Statistics Section
 st.markdown("### Statistics")
 
+# Count each status/decision once and look the totals up from those counts
+status_totals = filtered_summary.groupby('Candidate Status', observed=True)['n'].sum()
+status_counts = status_totals.to_dict()
+decision_counts = filtered_summary.groupby('Candidate Decision', observed=True)['n'].sum().to_dict()
+
 # Calculate correct pipeline statistics
-total_inquiries = len(filtered_df[filtered_df['Candidate Status'] == 'Inquiry'])
-total_applications = len(filtered_df[filtered_df['Candidate Status'].isin(['Applicant', 'File Complete', 'Decision', 'Contract'])])
-total_accepted = len(filtered_df[filtered_df['Candidate Decision'] == 'Accepted'])
-total_contracts = len(filtered_df[filtered_df['Candidate Status'] == 'Contract'])
+total_inquiries = status_counts.get('Inquiry', 0)
+total_applications = sum(status_counts.get(s, 0) for s in ('Applicant', 'File Complete', 'Decision', 'Contract'))
+total_accepted = decision_counts.get('Accepted', 0)
+total_contracts = status_counts.get('Contract', 0)
 
 # Create three columns for the first row of statistics
 col1, col2, col3 = st.columns(3)
@@ -98,235 +363,124 @@ with col7:
 
 st.markdown("---")  # Add a divider line
 
-# Tabs for different views
-tab1, tab2, tab3 = st.tabs(["Application Pipeline", "Demographics", "Timeline Analysis"])
-
-with tab1:
+# Each tab body is a fragment, so interactions inside one tab rerun only that tab
+@st.fragment
+def render_tab1(filtered_summary, status_totals):
     # Application Pipeline Funnel
     stages = ['Inquiry', 'Applicant', 'File Complete', 'Decision', 'Contract']
-    stage_counts = [len(filtered_df[filtered_df['Candidate Status'] == stage]) for stage in stages]
+    stage_counts = status_totals.reindex(stages, fill_value=0).tolist()
     
-    fig_funnel = go.Figure(go.Funnel(
-        y=stages,
-        x=stage_counts,
-        textinfo="value+percent initial"
-    ))
-    fig_funnel.update_layout(title_text="Application Pipeline Funnel")
-    st.plotly_chart(fig_funnel, use_container_width=True)
+    fig_funnel = build_funnel(tuple(stages), tuple(stage_counts))
+    st.plotly_chart(fig_funnel, key="funnel_chart", use_container_width=True)
     
     # Status by grade level
     st.subheader("Application Status by Grade Level")
     
-    # Define custom grade order
-    grade_order = [
-        'Kindergarten', 'Grade 1', 'Grade 2', 'Grade 3', 'Grade 4', 
-        'Grade 5', 'Grade 6', 'Grade 7', 'Grade 8', 'Grade 9', 
-        'Grade 10', 'Grade 11', 'Grade 12'
-    ]
-    
-    # Create crosstab for status
-    status_by_grade = pd.crosstab(filtered_df['Entering Grade'], 
-                                 filtered_df['Candidate Status'])
+    # Create grade x status table for status (rows follow the ordered grade categories)
+    status_by_grade = (filtered_summary
+                       .groupby(['Entering Grade', 'Candidate Status'], observed=True)['n']
+                       .sum()
+                       .unstack('Candidate Status', fill_value=0))
     
     # Create bar plot for status
-    fig_status = px.bar(status_by_grade,
-                       barmode='group',
-                       title="Application Status by Grade Level")
-    st.plotly_chart(fig_status, use_container_width=True)
+    fig_status = build_status_by_grade(status_by_grade)
+    st.plotly_chart(fig_status, key="status_by_grade_chart", use_container_width=True)
     
     # Inquiry Distribution Section
     st.subheader("Inquiry Distribution")
 
+    # Inquiry mask computed once and shared by both inquiry charts
+    is_inquiry = filtered_summary['Candidate Status'].eq('Inquiry').to_numpy()
+
     # 1. Inquiries by Grade Level
-    grade_inquiries = filtered_df[filtered_df['Candidate Status'] == 'Inquiry']['Entering Grade'].value_counts().reset_index()
-    grade_inquiries.columns = ['Grade Level', 'Number of Inquiries']
-    
-    # Sort by grade order
-    grade_inquiries['Grade Level'] = pd.Categorical(grade_inquiries['Grade Level'], 
-                                                  categories=grade_order,
-                                                  ordered=True)
-    grade_inquiries = grade_inquiries.sort_values('Grade Level')
-    
-    fig_grade_inquiry = go.Figure()
-    fig_grade_inquiry.add_trace(go.Bar(
-        x=grade_inquiries['Number of Inquiries'],
-        y=grade_inquiries['Grade Level'],
-        orientation='h',
-        marker_color='#3182CE',
-        text=grade_inquiries['Number of Inquiries'],
-        textposition='outside',
-    ))
-    
-    fig_grade_inquiry.update_layout(
-        title="Inquiries by Grade Level",
-        height=400,
-        yaxis={
-            'categoryorder': 'array',
-            'categoryarray': grade_inquiries['Grade Level'].tolist()[::-1],
-            'title': '',
-        },
-        xaxis={
-            'title': 'Number of Inquiries',
-            'showgrid': True,
-            'gridwidth': 1,
-            'gridcolor': 'LightGray'
-        },
-        showlegend=False,
-        margin=dict(l=20, r=20, t=40, b=20),
-        plot_bgcolor='white',
-    )
+    # observed=False keeps every grade category, already in grade order, with 0 for no inquiries
+    grade_inquiries = filtered_summary.loc[is_inquiry].groupby('Entering Grade', observed=False)['n'].sum()
     
+    fig_grade_inquiry = build_grade_inquiries(tuple(grade_inquiries.index),
+                                              tuple(grade_inquiries.values))
     st.plotly_chart(fig_grade_inquiry, key="grade_inquiry_chart", use_container_width=True)
     
     # 2. Inquiries by Month
-    # First filter by selected school year and inquiry status
-    inquiries_df = filtered_df[
-        (filtered_df['Candidate Status'] == 'Inquiry')
-    ].copy()
-    
-    # Convert dates properly
-    inquiries_df['Inquiry_Date'] = pd.to_datetime(
-        inquiries_df['Inquiry Date Submitted'],
-        format='mixed',
-        errors='coerce'
-    )
-    
-    # Extract month name
-    inquiries_df['Month'] = inquiries_df['Inquiry_Date'].dt.strftime('%B')
-    
-    # Get counts by month
-    monthly_counts = inquiries_df['Month'].value_counts().reset_index()
-    monthly_counts.columns = ['Month', 'Number of Inquiries']
-    
-    # Define month order for academic year
-    month_order = [
-        'August', 'September', 'October', 'November', 'December',
-        'January', 'February', 'March', 'April', 'May', 'June', 'July'
-    ]
-    
-    # Create base DataFrame with all months
-    all_months = pd.DataFrame({'Month': month_order})
-    
-    # Merge with counts and fill missing values
-    monthly_inquiries = pd.merge(
-        all_months,
-        monthly_counts,
-        on='Month',
-        how='left'
-    )
-    
-    # Fill NaN with 0 and ensure int type
-    monthly_inquiries['Number of Inquiries'] = monthly_inquiries['Number of Inquiries'].fillna(0).astype(int)
-    
-    # Set up categorical ordering of months
-    monthly_inquiries['Month'] = pd.Categorical(
-        monthly_inquiries['Month'],
-        categories=month_order,
-        ordered=True
-    )
-    
-    # Sort in reverse to match the grade level chart
-    monthly_inquiries = monthly_inquiries.sort_values('Month', ascending=False)
-    
-    # Create the horizontal bar chart
-    fig_monthly_inquiry = go.Figure()
-    
-    fig_monthly_inquiry.add_trace(go.Bar(
-        x=monthly_inquiries['Number of Inquiries'],
-        y=monthly_inquiries['Month'],
-        orientation='h',
-        marker_color='#3182CE',
-        text=monthly_inquiries['Number of Inquiries'],
-        textposition='outside',
-    ))
-    
-    fig_monthly_inquiry.update_layout(
-        title="Inquiries by Month",
-        height=400,
-        yaxis={
-            'categoryorder': 'array',
-            'categoryarray': month_order[::-1],
-            'title': '',
-        },
-        xaxis={
-            'title': 'Number of Inquiries',
-            'showgrid': True,
-            'gridwidth': 1,
-            'gridcolor': 'LightGray',
-            'range': [0, monthly_inquiries['Number of Inquiries'].max() * 1.1]  # Add 10% padding
-        },
-        showlegend=False,
-        margin=dict(l=20, r=20, t=40, b=20),
-        plot_bgcolor='white',
-    )
+    # observed=False keeps all 12 months in academic-year order, with 0 for no inquiries
+    monthly_inquiries = filtered_summary.loc[is_inquiry].groupby('InquiryMonth', observed=False)['n'].sum()
     
+    # Reverse to match the grade level chart
+    fig_monthly_inquiry = build_monthly_inquiries(tuple(monthly_inquiries.index[::-1]),
+                                                  tuple(monthly_inquiries.values[::-1]))
     st.plotly_chart(fig_monthly_inquiry, key="monthly_inquiries", use_container_width=True)
 
-with tab2:
+@st.fragment
+def render_tab2(year_key):
+    gender_dist, intl_dist, fa_dist = demographics(df, data_version, year_key)
+    
     col1, col2 = st.columns(2)
     
     with col1:
         # Gender distribution
-        gender_dist = filtered_df['Gender'].value_counts()
-        fig_gender = px.pie(values=gender_dist.values, 
-                          names=gender_dist.index,
-                          title="Gender Distribution")
-        st.plotly_chart(fig_gender)
+        fig_gender = build_pie(tuple(gender_dist.index), tuple(gender_dist.values),
+                               "Gender Distribution")
+        st.plotly_chart(fig_gender, key="gender_chart")
     
     with col2:
         # International vs Domestic
-        intl_dist = filtered_df['International'].value_counts()
-        fig_intl = px.pie(values=intl_dist.values,
-                         names=intl_dist.index,
-                         title="International vs Domestic Students")
-        st.plotly_chart(fig_intl)
+        fig_intl = build_pie(tuple(intl_dist.index), tuple(intl_dist.values),
+                             "International vs Domestic Students")
+        st.plotly_chart(fig_intl, key="international_chart")
     
     # Financial Aid distribution
-    fa_dist = filtered_df['Financial Aid'].value_counts()
-    fig_fa = px.bar(x=fa_dist.index,
-                    y=fa_dist.values,
-                    title="Financial Aid Distribution")
-    st.plotly_chart(fig_fa, use_container_width=True)
+    fig_fa = build_financial_aid(tuple(fa_dist.index), tuple(fa_dist.values))
+    st.plotly_chart(fig_fa, key="financial_aid_chart", use_container_width=True)
 
-with tab3:
+@st.fragment
+def render_tab3(filtered_summary, year_key):
     # Timeline analysis
-    if 'Application Date Submitted' in filtered_df.columns:
-        filtered_df['Application Month'] = filtered_df['Application Date Submitted'].dt.strftime('%Y-%m')
-        monthly_apps = filtered_df.groupby('Application Month').size().reset_index()
-        monthly_apps.columns = ['Month', 'Number of Applications']
-        monthly_apps = monthly_apps.sort_values('Month')
+    if 'Application Date Submitted' in df.columns:
+        # Resample to month starts so the x-axis is real dates and empty months show as 0
+        monthly_apps = (filtered_summary.groupby('Application Month')['n'].sum()
+                        .resample('MS').sum()
+                        .rename('Number of Applications')
+                        .rename_axis('Month')
+                        .reset_index())
         
-        fig_timeline = px.line(
-            monthly_apps,
-            x='Month',
-            y='Number of Applications',
-            title="Application Submissions Over Time",
-            markers=True
-        )
-        st.plotly_chart(fig_timeline, use_container_width=True)
+        fig_timeline = build_timeline(monthly_apps)
+        st.plotly_chart(fig_timeline, key="timeline_chart", use_container_width=True)
     
     # Average time to decision
-    filtered_df['Days_to_Decision'] = (filtered_df['School Decision Date'] - 
-                                     filtered_df['Application Date Submitted']).dt.days
-    avg_decision_time = filtered_df.groupby('Entering Year')['Days_to_Decision'].mean().reset_index()
+    avg_decision_time = decision_by_year.reindex(year_key).reset_index()
     avg_decision_time.columns = ['Year', 'Average Days']
     
-    fig_decision_time = px.bar(
-        avg_decision_time,
-        x='Year',
-        y='Average Days',
-        title="Average Days to Decision by Year"
-    )
-    st.plotly_chart(fig_decision_time, use_container_width=True)
+    fig_decision_time = build_decision_time(avg_decision_time)
+    st.plotly_chart(fig_decision_time, key="decision_time_chart", use_container_width=True)
+
+# Tabs for different views
+tab1, tab2, tab3 = st.tabs(["Application Pipeline", "Demographics", "Timeline Analysis"])
+
+with tab1:
+    render_tab1(filtered_summary, status_totals)
+
+with tab2:
+    render_tab2(year_key)
+
+with tab3:
+    render_tab3(filtered_summary, year_key)
 
 # Add download button for filtered data
 st.sidebar.download_button(
     label="Download Filtered Data",
-    data=filtered_df.to_csv(index=False).encode('utf-8'),
+    data=to_csv_bytes(df, data_version, year_key),
     file_name='filtered_enrollment_data.csv',
     mime='text/csv'
 )
 
+# Parquet is opt-in so a new selection only pays for the CSV serialization by default
+if st.sidebar.checkbox("Also offer Parquet download"):
+    st.sidebar.download_button(
+        label="Download Filtered Data (Parquet)",
+        data=to_parquet_bytes(df, data_version, year_key),
+        file_name='filtered_enrollment_data.parquet',
+        mime='application/octet-stream'
+    )
+
 ## add huge bar chart that lets you compare all inquery and application information for all years. 
 ## it should be easy for the admissions office to look at the data and compare month to month and year to year 
 #To see where they are and where they can improve. (See if you can find the good chart Nina showed you as an example)
\ No newline at end of file